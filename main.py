@@ -19,11 +19,30 @@ Key Concepts Demonstrated:
 """
 
 import streamlit as st
+import asyncio
+import atexit
+import collections
+import contextlib
+import hashlib
 import subprocess
 import json
 import os
+import queue
+import shutil
+import signal
+import threading
+import time
+import weakref
 from pathlib import Path
-from typing import Tuple, Dict, Optional
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from typing import Callable, Tuple, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # Optional C-accelerated JSON; stdlib json is the fallback
+    orjson = None
+
+_WORKER_JS = Path(__file__).with_name('worker.js')
 
 # Configuration
 CONFIG = {
@@ -32,7 +51,17 @@ CONFIG = {
     "timeout": 300,  # Increased to 5 minutes for complex operations
     "viewport": {"width": 1280, "height": 720},
     "analysis_timeout": 45000,  # 45 seconds for page analysis
-    "installation_timeout": 600  # 10 minutes for Puppeteer installation
+    "installation_timeout": 600,  # 10 minutes for Puppeteer installation
+    "screenshot_quality": 80,  # JPEG quality for demo screenshots
+    "research_concurrency": 4,  # Pages analysed in parallel per research batch
+    "worker_pool_size": 3,  # Node workers shared by all sessions for concurrent runs
+    "result_cache_ttl": 600  # Seconds a successful analysis is reused for the same targets
+}
+
+# Full-page screenshot encodings; JPEG's DCT is far cheaper to encode than PNG deflate
+_SCREENSHOT_OPTIONS = {
+    "jpeg": {"type": "jpeg", "quality": CONFIG["screenshot_quality"], "ext": "jpg"},
+    "png": {"type": "png", "ext": "png"}
 }
 
 class SystemManager:
@@ -41,39 +70,479 @@ class SystemManager:
     @staticmethod
     def find_executables() -> Tuple[Optional[str], Optional[str]]:
         """Cross-platform Node.js executable detection"""
-        node_path = npm_path = None
-        
-        try:
-            # Cross-platform executable discovery
-            result = subprocess.run(['where' if os.name == 'nt' else 'which', 'node'], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                node_path = result.stdout.strip().split('\n')[0]
-        except: pass
-        
-        try:
-            result = subprocess.run(['where' if os.name == 'nt' else 'which', 'npm'], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                npm_path = result.stdout.strip().split('\n')[0]
-        except: pass
-        
-        return node_path, npm_path
+        # In-process PATH walk (honours PATHEXT on Windows) - no where/which fork
+        return shutil.which('node'), shutil.which('npm')
     
     @staticmethod
     def validate_environment() -> Tuple[bool, Optional[str], Optional[str]]:
         """Environment validation with detailed feedback"""
-        node_path, npm_path = SystemManager.find_executables()
+        return _discover_env()
+
+@st.cache_resource
+def _discover_env() -> Tuple[bool, Optional[str], Optional[str]]:
+    """Executable discovery and version probe, run once per process"""
+    node_path, npm_path = SystemManager.find_executables()
+    
+    if not node_path:
+        return False, None, None
         
-        if not node_path:
-            return False, None, None
-            
-        try:
-            result = subprocess.run([node_path, '--version'], 
-                                  capture_output=True, text=True, timeout=10)
-            return result.returncode == 0, node_path, npm_path
-        except:
-            return False, None, None
+    try:
+        return asyncio.run(_probe_version(node_path)), node_path, npm_path
+    except OSError:  # Not executable / vanished between lookup and launch
+        return False, None, None
+
+def _puppeteer_installed() -> bool:
+    """Puppeteer is resolvable from node_modules (a bare or partial folder doesn't count)"""
+    # Checked once per session rather than on every rerun; a successful install
+    # sets it, and a page reload re-checks after an install made outside the app
+    if "pup_installed" not in st.session_state:
+        st.session_state.pup_installed = Path('node_modules/puppeteer/package.json').is_file()
+    return st.session_state.pup_installed
+
+async def _probe_version(executable: str) -> bool:
+    """Non-blocking `--version` probe with kill-on-timeout"""
+    proc = await asyncio.create_subprocess_exec(executable, '--version',
+                                                stdout=asyncio.subprocess.PIPE,
+                                                stderr=asyncio.subprocess.PIPE)
+    try:
+        await asyncio.wait_for(proc.communicate(), timeout=10)
+    except asyncio.TimeoutError:
+        proc.kill()
+    # Reap explicitly so the loop closes with no child left to waitpid()
+    await proc.wait()
+    return proc.returncode == 0
+
+# Long-lived browser owned by a node sidecar; generated scripts connect to its
+# WebSocket endpoint instead of paying a Chromium cold start per action.
+# The sidecar closes the browser when its stdin hits EOF (parent went away).
+_BROWSER_SIDECAR_JS = """
+        const puppeteer = require('puppeteer');
+        
+        puppeteer.launch({
+            headless: 'new',
+            defaultViewport: { width: 1280, height: 720 },
+            args: [
+                '--no-sandbox', '--disable-setuid-sandbox', '--disable-gpu',
+                '--disable-dev-shm-usage', '--disable-extensions',
+                '--disable-background-networking',
+                '--disable-features=IsolateOrigins,site-per-process',
+                '--no-first-run', '--no-zygote'
+            ]
+        }).then(browser => {
+            process.stdout.write(browser.wsEndpoint() + '\\n');
+            process.stdin.on('end', () => browser.close().then(() => process.exit(0)));
+            process.stdin.resume();
+        }).catch(error => { console.error(error.message); process.exit(1); });
+        """
+
+# Shared page analyzer: both report formats log from the same metrics object,
+# so the DOM is analysed by one canonical function.
+_ANALYZE_JS = """
+        async function analyze(page) {
+            return page.evaluate(() => {
+                // One walk over the DOM tallies every tag and evaluates the
+                // attribute-qualified selectors inline, instead of a separate
+                // selector scan per metric
+                const all = document.getElementsByTagName('*');
+                const counts = Object.create(null);
+                const host = window.location.hostname;
+                const focusableTags = { A: 1, BUTTON: 1, INPUT: 1, SELECT: 1, TEXTAREA: 1 };
+                let externalLinks = 0, stylesheets = 0, structuredData = 0;
+                let ariaLabels = 0, focusable = 0, imagesMissingAlt = 0;
+                for (let i = 0; i < all.length; i++) {
+                    const el = all[i];
+                    const tag = el.tagName;
+                    counts[tag] = (counts[tag] | 0) + 1;
+                    if (el.hasAttribute('aria-label')) ariaLabels++;
+                    if (focusableTags[tag] || el.hasAttribute('tabindex')) focusable++;
+                    if (tag === 'A') {
+                        // mailto:/tel:/javascript: links have no hostname and aren't external
+                        if (el.href && el.hostname && el.hostname !== host) externalLinks++;
+                    } else if (tag === 'IMG') {
+                        if (!el.alt) imagesMissingAlt++;
+                    } else if (tag === 'LINK') {
+                        if (el.getAttribute('rel') === 'stylesheet') stylesheets++;
+                    } else if (tag === 'SCRIPT') {
+                        if (el.getAttribute('type') === 'application/ld+json') structuredData++;
+                    }
+                }
+                
+                const countElements = (tag) => counts[tag] | 0;
+                
+                const getMetaTags = () => {
+                    const metas = {};
+                    document.querySelectorAll('meta').forEach(meta => {
+                        const name = meta.getAttribute('name') || meta.getAttribute('property');
+                        if (name) metas[name] = meta.getAttribute('content');
+                    });
+                    return metas;
+                };
+                
+                const analyzeColors = () => {
+                    const styles = window.getComputedStyle(document.body);
+                    return {
+                        backgroundColor: styles.backgroundColor,
+                        color: styles.color,
+                        fontFamily: styles.fontFamily,
+                        fontSize: styles.fontSize
+                    };
+                };
+                
+                const checkAccessibility = () => {
+                    return {
+                        hasAltTexts: imagesMissingAlt === 0,
+                        hasAriaLabels: ariaLabels,
+                        hasHeadingStructure: countElements('H1') > 0,
+                        hasLangAttribute: document.documentElement.hasAttribute('lang'),
+                        focusableElements: focusable
+                    };
+                };
+                
+                // Count words with a single character scan rather than
+                // allocating an array of every word on the page
+                const text = document.body.innerText;
+                const textLength = text.length;
+                let wordCount = 0;
+                for (let i = 0, inWord = false; i < textLength; i++) {
+                    const c = text.charCodeAt(i);
+                    const ws = c === 32 || c === 9 || c === 10 || c === 13 || c === 160;
+                    if (!ws && !inWord) { wordCount++; inWord = true; }
+                    else if (ws) inWord = false;
+                }
+                
+                return {
+                    // Basic Information
+                    basic: {
+                        title: document.title,
+                        url: window.location.href,
+                        domain: window.location.hostname,
+                        protocol: window.location.protocol,
+                        charset: document.characterSet,
+                        language: document.documentElement.lang || 'Not specified',
+                        lastModified: document.lastModified
+                    },
+                    
+                    // Content Analysis
+                    content: {
+                        textLength: textLength,
+                        wordCount: wordCount,
+                        readingTime: Math.ceil(wordCount / 200), // avg 200 wpm
+                        totalLinks: countElements('A'),
+                        externalLinks: externalLinks,
+                        images: countElements('IMG'),
+                        videos: countElements('VIDEO'),
+                        audios: countElements('AUDIO')
+                    },
+                    
+                    // Structure Analysis
+                    structure: {
+                        headings: {
+                            h1: countElements('H1'),
+                            h2: countElements('H2'),
+                            h3: countElements('H3'),
+                            h4: countElements('H4'),
+                            h5: countElements('H5'),
+                            h6: countElements('H6')
+                        },
+                        lists: countElements('UL') + countElements('OL'),
+                        tables: countElements('TABLE'),
+                        forms: countElements('FORM'),
+                        buttons: countElements('BUTTON'),
+                        inputs: countElements('INPUT'),
+                        paragraphs: countElements('P'),
+                        divs: countElements('DIV'),
+                        spans: countElements('SPAN')
+                    },
+                    
+                    // Technical Analysis
+                    technical: {
+                        totalElements: all.length,
+                        scripts: countElements('SCRIPT'),
+                        stylesheets: stylesheets,
+                        hasServiceWorker: 'serviceWorker' in navigator,
+                        hasWebGL: !!window.WebGLRenderingContext,
+                        hasGeolocation: 'geolocation' in navigator,
+                        hasLocalStorage: typeof(Storage) !== "undefined",
+                        viewportWidth: window.innerWidth,
+                        viewportHeight: window.innerHeight,
+                        screenWidth: window.screen.width,
+                        screenHeight: window.screen.height
+                    },
+                    
+                    // Performance Metrics
+                    performance: {
+                        loadTime: performance.timing.loadEventEnd - performance.timing.navigationStart,
+                        domContentLoaded: performance.timing.domContentLoadedEventEnd - performance.timing.navigationStart,
+                        firstPaint: performance.getEntriesByType('paint').find(p => p.name === 'first-paint')?.startTime || 'N/A',
+                        firstContentfulPaint: performance.getEntriesByType('paint').find(p => p.name === 'first-contentful-paint')?.startTime || 'N/A'
+                    },
+                    
+                    // SEO Analysis
+                    seo: {
+                        metaTags: getMetaTags(),
+                        hasTitle: !!document.title,
+                        titleLength: document.title.length,
+                        hasMetaDescription: !!document.querySelector('meta[name="description"]'),
+                        hasCanonical: !!document.querySelector('link[rel="canonical"]'),
+                        hasRobots: !!document.querySelector('meta[name="robots"]'),
+                        structuredData: structuredData
+                    },
+                    
+                    // Design Analysis
+                    design: analyzeColors(),
+                    
+                    // Accessibility Check
+                    accessibility: checkAccessibility()
+                };
+            });
+        }
+        """
+
+# Script templates are assembled once at import time; only the research targets
+# and screenshot options vary per request and are substituted as JSON literals.
+# Each script is an async function body run by worker.js with `browser` (a fresh
+# incognito BrowserContext of the shared browser, closed by the worker after the
+# run - don't close() or disconnect() it), `console` and `emit` in scope.
+_SCRIPT_BASE = """
+        const RE_TS = /[:.]/g;  // ISO timestamp -> filename-safe
+        """ + _ANALYZE_JS + """
+        let page;
+        try {
+                console.log('🚀 Starting browser automation session...');
+        """
+
+_SCRIPT_TAIL = """
+} finally { if (page) await page.close().catch(() => {}); }"""
+
+_SCRIPT_TEMPLATES = {
+    "demo": _SCRIPT_BASE + f"""
+                page = await browser.newPage();
+                console.log('📖 Academic Demo: Comprehensive Research Portal Analysis...');
+                await page.goto('https://scholar.google.com', {{ 
+                    waitUntil: 'load', timeout: {CONFIG["analysis_timeout"]}
+                }});
+                
+                // Comprehensive page analysis
+                console.log('🔍 Performing detailed page analysis...');
+                const analysis = await analyze(page);
+                
+                // Take screenshot with timestamp
+                const shot = __SCREENSHOT__;
+                const timestamp = new Date().toISOString().replace(RE_TS, '-');
+                const screenshotPath = `academic_demo_${{timestamp}}.${{shot.ext}}`;
+                await page.screenshot({{ 
+                    path: screenshotPath, 
+                    fullPage: true,
+                    type: shot.type,
+                    quality: shot.quality
+                }});
+                console.log(`📸 Full-page screenshot saved: ${{screenshotPath}}`);
+                emit({{ type: 'screenshot', path: screenshotPath }});
+                
+                // Emit the analysis as one JSON line; the report is formatted in Python
+                emit({{ type: 'report', action: 'demo', data: analysis }});
+                
+                console.log('✅ Comprehensive academic demo completed successfully');
+            """ + _SCRIPT_TAIL,
+    
+    "research": _SCRIPT_BASE + f"""
+                const urls = __URLS_JSON__;
+                console.log(`🔬 ADVANCED RESEARCH MODE: Deep Analysis of ${{urls.length}} site(s)`);
+                console.log('=' .repeat(60));
+                
+                // Small page pool over the shared browser: K tabs drain the URL queue
+                const queue = urls.slice();
+                let analysed = 0;
+                const worker = async () => {{
+                    while (queue.length) {{
+                        const url = queue.shift();
+                        const tab = await browser.newPage();
+                        try {{
+                            console.log(`🌐 Loading ${{url}}...`);
+                            await tab.goto(url, {{ 
+                                waitUntil: 'load', 
+                                timeout: {CONFIG["analysis_timeout"]}
+                            }});
+                            
+                            console.log(`⏱️ ${{url}} loaded, beginning comprehensive analysis...`);
+                            const detailedMetrics = await analyze(tab);
+                            
+                            // Emit each analysis as one JSON line; reports are formatted in Python
+                            emit({{ type: 'report', action: 'research', url, data: detailedMetrics }});
+                            analysed++;
+                        }} catch (error) {{
+                            console.error(`❌ ${{url}}: ${{error.message}}`);
+                        }} finally {{
+                            await tab.close().catch(() => {{}});
+                        }}
+                    }}
+                }};
+                await Promise.all(Array.from({{ length: Math.min({CONFIG["research_concurrency"]}, urls.length) }}, worker));
+                if (!analysed) throw new Error('No site could be analysed');
+                
+                console.log('🎯 Advanced research analysis completed successfully');
+            """ + _SCRIPT_TAIL,
+    
+    "default": _SCRIPT_BASE + """
+                page = await browser.newPage();
+                console.log('📖 Default demo mode');
+                await page.goto('https://example.com');
+            """ + _SCRIPT_TAIL
+}
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _build_script(action: str, urls: Tuple[str, ...] = (), screenshot_format: str = "jpeg") -> str:
+    """Fill a script template; memoized since the output is a pure function of the args"""
+    if action == "research":
+        return _SCRIPT_TEMPLATES["research"].replace("__URLS_JSON__", json.dumps(list(urls)))
+    
+    if action == "demo":
+        screenshot = _SCREENSHOT_OPTIONS[screenshot_format]
+        return _SCRIPT_TEMPLATES["demo"].replace("__SCREENSHOT__", json.dumps(screenshot))
+    
+    return _SCRIPT_TEMPLATES.get(action, _SCRIPT_TEMPLATES["default"])
+
+def _format_demo_report(m: Dict) -> str:
+    """Human-readable academic demo report from the analyzer metrics"""
+    basic, content, structure, technical = m["basic"], m["content"], m["structure"], m["technical"]
+    headings = structure["headings"]
+    efficiency = content["textLength"] / (technical["totalElements"] or 1)
+    link_density = content["totalLinks"] / (content["wordCount"] or 1) * 100
+    available = lambda flag: 'Available' if flag else 'Not Available'
+    
+    return f"""📊 COMPREHENSIVE WEBSITE ANALYSIS REPORT
+{'=' * 50}
+📝 Title: {basic['title']}
+🌐 URL: {basic['url']}
+📅 Last Modified: {basic['lastModified']}
+⚡ Load Time: {m['performance']['loadTime']}ms
+
+🔗 LINK ANALYSIS:
+   Total Links: {content['totalLinks']}
+   External Links: {content['externalLinks']}
+   Internal Links: {content['totalLinks'] - content['externalLinks']}
+
+🏗️ STRUCTURE ANALYSIS:
+   H1 Headings: {headings['h1']}
+   H2 Headings: {headings['h2']}
+   H3 Headings: {headings['h3']}
+   Total DOM Elements: {technical['totalElements']}
+   Paragraphs: {structure['paragraphs']}
+   Lists: {structure['lists']}
+   Tables: {structure['tables']}
+
+📝 CONTENT METRICS:
+   Text Length: {content['textLength']:,} characters
+   Word Count: {content['wordCount']:,} words
+   Images: {content['images']}
+
+⚙️ INTERACTIVE ELEMENTS:
+   Forms: {structure['forms']}
+   Buttons: {structure['buttons']}
+   Input Fields: {structure['inputs']}
+
+🖥️ TECHNICAL DETAILS:
+   Viewport: {technical['viewportWidth']}x{technical['viewportHeight']}
+   Character Set: {basic['charset']}
+   Service Worker: {available(technical['hasServiceWorker'])}
+   Local Storage: {available(technical['hasLocalStorage'])}
+
+📈 EFFICIENCY METRICS:
+   Content Efficiency: {efficiency:.2f} chars/element
+   Link Density: {link_density:.2f}% (links per 100 words)
+   Heading Structure: {'Good' if headings['h1'] > 0 else 'Missing H1'}"""
+
+def _format_research_report(m: Dict) -> str:
+    """Human-readable research report from the analyzer metrics"""
+    basic, content, structure = m["basic"], m["content"], m["structure"]
+    technical, performance, seo, accessibility = m["technical"], m["performance"], m["seo"], m["accessibility"]
+    total_headings = sum(structure["headings"].values())
+    check = lambda flag: '✅' if flag else '❌'
+    
+    # Quality scores
+    content_quality = min(100, content["wordCount"] / 10)
+    structure_quality = min(100, total_headings * 10)
+    seo_quality = sum(map(bool, [
+        seo["hasTitle"],
+        seo["hasMetaDescription"],
+        10 < seo["titleLength"] < 60
+    ])) * 33.33
+    
+    return f"""📊 DETAILED RESEARCH ANALYSIS REPORT
+{'=' * 60}
+📋 BASIC INFORMATION:
+   Title: {basic['title']}
+   URL: {basic['url']}
+   Domain: {basic['domain']}
+   Protocol: {basic['protocol']}
+   Language: {basic['language']}
+   Character Set: {basic['charset']}
+   Last Modified: {basic['lastModified']}
+
+📝 CONTENT ANALYSIS:
+   Word Count: {content['wordCount']:,} words
+   Character Count: {content['textLength']:,} characters
+   Estimated Reading Time: {content['readingTime']} minutes
+   Total Links: {content['totalLinks']}
+   External Links: {content['externalLinks']}
+   Internal Links: {content['totalLinks'] - content['externalLinks']}
+   Images: {content['images']}
+   Videos: {content['videos']}
+   Audio Elements: {content['audios']}
+
+🏗️ STRUCTURE ANALYSIS:
+   H1 Tags: {structure['headings']['h1']}
+   H2 Tags: {structure['headings']['h2']}
+   H3 Tags: {structure['headings']['h3']}
+   Total Headings: {total_headings}
+   Paragraphs: {structure['paragraphs']}
+   Lists: {structure['lists']}
+   Tables: {structure['tables']}
+   Forms: {structure['forms']}
+   Interactive Elements: {structure['buttons'] + structure['inputs']}
+
+⚙️ TECHNICAL ANALYSIS:
+   Total DOM Elements: {technical['totalElements']:,}
+   JavaScript Files: {technical['scripts']}
+   CSS Stylesheets: {technical['stylesheets']}
+   Viewport: {technical['viewportWidth']}x{technical['viewportHeight']}
+   Screen Resolution: {technical['screenWidth']}x{technical['screenHeight']}
+   Modern Features:
+     - Service Worker: {check(technical['hasServiceWorker'])}
+     - WebGL: {check(technical['hasWebGL'])}
+     - Geolocation: {check(technical['hasGeolocation'])}
+     - Local Storage: {check(technical['hasLocalStorage'])}
+
+⚡ PERFORMANCE METRICS:
+   Total Load Time: {performance['loadTime']}ms
+   DOM Content Loaded: {performance['domContentLoaded']}ms
+   First Paint: {performance['firstPaint']}ms
+   First Contentful Paint: {performance['firstContentfulPaint']}ms
+
+🔍 SEO ANALYSIS:
+   Page Title: {check(seo['hasTitle'])} ({seo['titleLength']} chars)
+   Meta Description: {check(seo['hasMetaDescription'])}
+   Canonical URL: {check(seo['hasCanonical'])}
+   Robots Meta: {check(seo['hasRobots'])}
+   Structured Data: {seo['structuredData']} schemas found
+
+♿ ACCESSIBILITY ANALYSIS:
+   Alt Text Coverage: {'✅ Complete' if accessibility['hasAltTexts'] else '❌ Incomplete'}
+   ARIA Labels: {accessibility['hasAriaLabels']} elements
+   Heading Structure: {'✅ Present' if accessibility['hasHeadingStructure'] else '❌ Missing'}
+   Language Attribute: {'✅ Present' if accessibility['hasLangAttribute'] else '❌ Missing'}
+   Focusable Elements: {accessibility['focusableElements']}
+
+📈 QUALITY SCORES:
+   Content Quality: {content_quality:.1f}%
+   Structure Quality: {structure_quality:.1f}%
+   SEO Quality: {seo_quality:.1f}%
+   Performance Score: {'✅ Good' if performance['loadTime'] < 3000 else '⚠️ Needs Improvement'}"""
+
+_REPORT_FORMATTERS = {
+    "demo": _format_demo_report,
+    "research": _format_research_report
+}
 
 class PuppeteerManager:
     """Handles Puppeteer installation and script execution"""
@@ -81,7 +550,7 @@ class PuppeteerManager:
     @staticmethod
     def ensure_installation(npm_path: str) -> Dict[str, any]:
         """Smart dependency installation with enhanced feedback"""
-        if Path('node_modules').exists():
+        if _puppeteer_installed():
             return {"success": True, "message": "Dependencies already installed"}
         
         # Create comprehensive package.json with additional dev tools
@@ -103,13 +572,24 @@ class PuppeteerManager:
         }
         
         try:
-            with open('package.json', 'w') as f:
-                json.dump(package_config, f, indent=2)
+            if orjson:
+                package_json = orjson.dumps(package_config, option=orjson.OPT_INDENT_2)
+            else:
+                package_json = json.dumps(package_config, indent=2).encode('utf-8')
+            
+            # Only touch package.json when its contents would actually change
+            package_file = Path('package.json')
+            if not package_file.is_file() or package_file.read_bytes() != package_json:
+                package_file.write_bytes(package_json)
             
             result = subprocess.run([npm_path, 'install'], 
                                   capture_output=True, text=True, 
+                                  encoding='utf-8', errors='replace',
                                   timeout=CONFIG["installation_timeout"])
             
+            if result.returncode == 0:
+                st.session_state.pup_installed = True
+            
             return {
                 "success": result.returncode == 0,
                 "message": "Installation successful" if result.returncode == 0 else result.stderr,
@@ -125,451 +605,604 @@ class PuppeteerManager:
     @staticmethod
     def create_script(action: str, **kwargs) -> str:
         """Dynamic JavaScript generation for different automation tasks"""
-        
-        base_config = """
-        const puppeteer = require('puppeteer');
-        const delay = ms => new Promise(resolve => setTimeout(resolve, ms));
-        
-        (async () => {
-            try {
-                console.log('🚀 Initializing browser automation...');
-                
-                const browser = await puppeteer.launch({
-                    headless: false,
-                    defaultViewport: { width: 1280, height: 720 },
-                    args: ['--no-sandbox', '--disable-setuid-sandbox']
-                });
-                
-                const page = await browser.newPage();
-        """
-        
-        if action == "demo":
-            script_body = f"""
-                console.log('📖 Academic Demo: Comprehensive Research Portal Analysis...');
-                await page.goto('https://scholar.google.com', {{ 
-                    waitUntil: 'networkidle2', timeout: {CONFIG["analysis_timeout"]}
-                }});
-                
-                // Comprehensive page analysis
-                console.log('🔍 Performing detailed page analysis...');
-                const analysis = await page.evaluate(() => {{
-                    const getTextContent = (selector) => {{
-                        const el = document.querySelector(selector);
-                        return el ? el.textContent.trim() : 'Not found';
-                    }};
-                    
-                    const countElements = (selector) => document.querySelectorAll(selector).length;
-                    
-                    return {{
-                        // Basic metadata
-                        title: document.title,
-                        url: window.location.href,
-                        charset: document.characterSet,
-                        lastModified: document.lastModified,
-                        
-                        // Content analysis
-                        totalLinks: countElements('a'),
-                        externalLinks: Array.from(document.querySelectorAll('a')).filter(a => 
-                            a.href && !a.href.includes(window.location.hostname)).length,
-                        images: countElements('img'),
-                        forms: countElements('form'),
-                        buttons: countElements('button'),
-                        inputs: countElements('input'),
-                        
-                        // Structure analysis
-                        headings: {{
-                            h1: countElements('h1'),
-                            h2: countElements('h2'),
-                            h3: countElements('h3'),
-                            h4: countElements('h4'),
-                            h5: countElements('h5'),
-                            h6: countElements('h6')
-                        }},
-                        
-                        // Content metrics
-                        textLength: document.body.innerText.length,
-                        wordCount: document.body.innerText.split(/\\s+/).length,
-                        paragraphs: countElements('p'),
-                        lists: countElements('ul, ol'),
-                        tables: countElements('table'),
-                        
-                        // Technical analysis
-                        hasServiceWorker: 'serviceWorker' in navigator,
-                        hasLocalStorage: typeof(Storage) !== "undefined",
-                        viewportWidth: window.innerWidth,
-                        viewportHeight: window.innerHeight,
-                        
-                        // Performance hints
-                        loadTime: performance.timing.loadEventEnd - performance.timing.navigationStart,
-                        domElements: document.getElementsByTagName('*').length
-                    }};
-                }});
-                
-                // Display comprehensive analysis
-                console.log('📊 COMPREHENSIVE WEBSITE ANALYSIS REPORT');
-                console.log('=' .repeat(50));
-                console.log(`📝 Title: ${{analysis.title}}`);
-                console.log(`🌐 URL: ${{analysis.url}}`);
-                console.log(`📅 Last Modified: ${{analysis.lastModified}}`);
-                console.log(`⚡ Load Time: ${{analysis.loadTime}}ms`);
-                console.log('');
-                
-                console.log('🔗 LINK ANALYSIS:');
-                console.log(`   Total Links: ${{analysis.totalLinks}}`);
-                console.log(`   External Links: ${{analysis.externalLinks}}`);
-                console.log(`   Internal Links: ${{analysis.totalLinks - analysis.externalLinks}}`);
-                console.log('');
-                
-                console.log('🏗️ STRUCTURE ANALYSIS:');
-                console.log(`   H1 Headings: ${{analysis.headings.h1}}`);
-                console.log(`   H2 Headings: ${{analysis.headings.h2}}`);
-                console.log(`   H3 Headings: ${{analysis.headings.h3}}`);
-                console.log(`   Total DOM Elements: ${{analysis.domElements}}`);
-                console.log(`   Paragraphs: ${{analysis.paragraphs}}`);
-                console.log(`   Lists: ${{analysis.lists}}`);
-                console.log(`   Tables: ${{analysis.tables}}`);
-                console.log('');
-                
-                console.log('📝 CONTENT METRICS:');
-                console.log(`   Text Length: ${{analysis.textLength.toLocaleString()}} characters`);
-                console.log(`   Word Count: ${{analysis.wordCount.toLocaleString()}} words`);
-                console.log(`   Images: ${{analysis.images}}`);
-                console.log('');
-                
-                console.log('⚙️ INTERACTIVE ELEMENTS:');
-                console.log(`   Forms: ${{analysis.forms}}`);
-                console.log(`   Buttons: ${{analysis.buttons}}`);
-                console.log(`   Input Fields: ${{analysis.inputs}}`);
-                console.log('');
-                
-                console.log('🖥️ TECHNICAL DETAILS:');
-                console.log(`   Viewport: ${{analysis.viewportWidth}}x${{analysis.viewportHeight}}`);
-                console.log(`   Character Set: ${{analysis.charset}}`);
-                console.log(`   Service Worker: ${{analysis.hasServiceWorker ? 'Available' : 'Not Available'}}`);
-                console.log(`   Local Storage: ${{analysis.hasLocalStorage ? 'Available' : 'Not Available'}}`);
-                console.log('');
-                
-                // Take screenshot with timestamp
-                const timestamp = new Date().toISOString().replace(/[:.]/g, '-');
-                const screenshotPath = `academic_demo_${{timestamp}}.png`;
-                await page.screenshot({{ 
-                    path: screenshotPath, 
-                    fullPage: true,
-                    type: 'png'
-                }});
-                console.log(`📸 Full-page screenshot saved: ${{screenshotPath}}`);
-                
-                // Generate summary report
-                const efficiency = analysis.textLength / analysis.domElements;
-                const linkDensity = (analysis.totalLinks / analysis.wordCount * 100).toFixed(2);
-                
-                console.log('📈 EFFICIENCY METRICS:');
-                console.log(`   Content Efficiency: ${{efficiency.toFixed(2)}} chars/element`);
-                console.log(`   Link Density: ${{linkDensity}}% (links per 100 words)`);
-                console.log(`   Heading Structure: ${{analysis.headings.h1 > 0 ? 'Good' : 'Missing H1'}}`);
-                
-                await delay(5000);
-                await browser.close();
-                console.log('✅ Comprehensive academic demo completed successfully');
-            """
-        
-        elif action == "research":
-            url = kwargs.get("url", "https://example.com")
-            script_body = f"""
-                const url = '{url}';
-                console.log(`🔬 ADVANCED RESEARCH MODE: Deep Analysis of ${{url}}`);
-                console.log('=' .repeat(60));
-                
-                // Navigate with extended timeout
-                await page.goto(url, {{ 
-                    waitUntil: 'networkidle2', 
-                    timeout: {CONFIG["analysis_timeout"]}
-                }});
-                
-                console.log('⏱️ Page loaded, beginning comprehensive analysis...');
-                
-                // Advanced metrics collection
-                const detailedMetrics = await page.evaluate(() => {{
-                    // Helper functions
-                    const getTextContent = (selector) => {{
-                        const el = document.querySelector(selector);
-                        return el ? el.textContent.trim() : null;
-                    }};
-                    
-                    const countElements = (selector) => document.querySelectorAll(selector).length;
-                    
-                    const getMetaTags = () => {{
-                        const metas = {{}};
-                        document.querySelectorAll('meta').forEach(meta => {{
-                            const name = meta.getAttribute('name') || meta.getAttribute('property');
-                            if (name) metas[name] = meta.getAttribute('content');
-                        }});
-                        return metas;
-                    }};
-                    
-                    const analyzeColors = () => {{
-                        const styles = window.getComputedStyle(document.body);
-                        return {{
-                            backgroundColor: styles.backgroundColor,
-                            color: styles.color,
-                            fontFamily: styles.fontFamily,
-                            fontSize: styles.fontSize
-                        }};
-                    }};
-                    
-                    const checkAccessibility = () => {{
-                        return {{
-                            hasAltTexts: Array.from(document.querySelectorAll('img')).every(img => img.alt),
-                            hasAriaLabels: countElements('[aria-label]'),
-                            hasHeadingStructure: countElements('h1') > 0,
-                            hasLangAttribute: document.documentElement.hasAttribute('lang'),
-                            focusableElements: countElements('a, button, input, select, textarea, [tabindex]')
-                        }};
-                    }};
-                    
-                    return {{
-                        // Basic Information
-                        basic: {{
-                            title: document.title,
-                            url: window.location.href,
-                            domain: window.location.hostname,
-                            protocol: window.location.protocol,
-                            charset: document.characterSet,
-                            language: document.documentElement.lang || 'Not specified',
-                            lastModified: document.lastModified
-                        }},
-                        
-                        // Content Analysis
-                        content: {{
-                            textLength: document.body.innerText.length,
-                            wordCount: document.body.innerText.split(/\\s+/).filter(word => word.length > 0).length,
-                            readingTime: Math.ceil(document.body.innerText.split(/\\s+/).length / 200), // avg 200 wpm
-                            totalLinks: countElements('a'),
-                            externalLinks: Array.from(document.querySelectorAll('a')).filter(a => 
-                                a.href && !a.href.includes(window.location.hostname)).length,
-                            images: countElements('img'),
-                            videos: countElements('video'),
-                            audios: countElements('audio')
-                        }},
-                        
-                        // Structure Analysis
-                        structure: {{
-                            headings: {{
-                                h1: countElements('h1'),
-                                h2: countElements('h2'),
-                                h3: countElements('h3'),
-                                h4: countElements('h4'),
-                                h5: countElements('h5'),
-                                h6: countElements('h6')
-                            }},
-                            lists: countElements('ul, ol'),
-                            tables: countElements('table'),
-                            forms: countElements('form'),
-                            buttons: countElements('button'),
-                            inputs: countElements('input'),
-                            paragraphs: countElements('p'),
-                            divs: countElements('div'),
-                            spans: countElements('span')
-                        }},
-                        
-                        // Technical Analysis
-                        technical: {{
-                            totalElements: document.querySelectorAll('*').length,
-                            scripts: countElements('script'),
-                            stylesheets: countElements('link[rel="stylesheet"]'),
-                            hasServiceWorker: 'serviceWorker' in navigator,
-                            hasWebGL: !!window.WebGLRenderingContext,
-                            hasGeolocation: 'geolocation' in navigator,
-                            hasLocalStorage: typeof(Storage) !== "undefined",
-                            viewportWidth: window.innerWidth,
-                            viewportHeight: window.innerHeight,
-                            screenWidth: window.screen.width,
-                            screenHeight: window.screen.height
-                        }},
-                        
-                        // Performance Metrics
-                        performance: {{
-                            loadTime: performance.timing.loadEventEnd - performance.timing.navigationStart,
-                            domContentLoaded: performance.timing.domContentLoadedEventEnd - performance.timing.navigationStart,
-                            firstPaint: performance.getEntriesByType('paint').find(p => p.name === 'first-paint')?.startTime || 'N/A',
-                            firstContentfulPaint: performance.getEntriesByType('paint').find(p => p.name === 'first-contentful-paint')?.startTime || 'N/A'
-                        }},
-                        
-                        // SEO Analysis
-                        seo: {{
-                            metaTags: getMetaTags(),
-                            hasTitle: !!document.title,
-                            titleLength: document.title.length,
-                            hasMetaDescription: !!document.querySelector('meta[name="description"]'),
-                            hasCanonical: !!document.querySelector('link[rel="canonical"]'),
-                            hasRobots: !!document.querySelector('meta[name="robots"]'),
-                            structuredData: countElements('script[type="application/ld+json"]')
-                        }},
-                        
-                        // Design Analysis
-                        design: analyzeColors(),
-                        
-                        // Accessibility Check
-                        accessibility: checkAccessibility()
-                    }};
-                }});
-                
-                // Generate comprehensive report
-                console.log('📊 DETAILED RESEARCH ANALYSIS REPORT');
-                console.log('=' .repeat(60));
-                
-                // Basic Information
-                console.log('📋 BASIC INFORMATION:');
-                console.log(`   Title: ${{detailedMetrics.basic.title}}`);
-                console.log(`   Domain: ${{detailedMetrics.basic.domain}}`);
-                console.log(`   Protocol: ${{detailedMetrics.basic.protocol}}`);
-                console.log(`   Language: ${{detailedMetrics.basic.language}}`);
-                console.log(`   Character Set: ${{detailedMetrics.basic.charset}}`);
-                console.log(`   Last Modified: ${{detailedMetrics.basic.lastModified}}`);
-                console.log('');
-                
-                // Content Metrics
-                console.log('📝 CONTENT ANALYSIS:');
-                console.log(`   Word Count: ${{detailedMetrics.content.wordCount.toLocaleString()}} words`);
-                console.log(`   Character Count: ${{detailedMetrics.content.textLength.toLocaleString()}} characters`);
-                console.log(`   Estimated Reading Time: ${{detailedMetrics.content.readingTime}} minutes`);
-                console.log(`   Total Links: ${{detailedMetrics.content.totalLinks}}`);
-                console.log(`   External Links: ${{detailedMetrics.content.externalLinks}}`);
-                console.log(`   Internal Links: ${{detailedMetrics.content.totalLinks - detailedMetrics.content.externalLinks}}`);
-                console.log(`   Images: ${{detailedMetrics.content.images}}`);
-                console.log(`   Videos: ${{detailedMetrics.content.videos}}`);
-                console.log(`   Audio Elements: ${{detailedMetrics.content.audios}}`);
-                console.log('');
-                
-                // Structure Analysis
-                console.log('🏗️ STRUCTURE ANALYSIS:');
-                console.log(`   H1 Tags: ${{detailedMetrics.structure.headings.h1}}`);
-                console.log(`   H2 Tags: ${{detailedMetrics.structure.headings.h2}}`);
-                console.log(`   H3 Tags: ${{detailedMetrics.structure.headings.h3}}`);
-                console.log(`   Total Headings: ${{Object.values(detailedMetrics.structure.headings).reduce((a,b) => a+b, 0)}}`);
-                console.log(`   Paragraphs: ${{detailedMetrics.structure.paragraphs}}`);
-                console.log(`   Lists: ${{detailedMetrics.structure.lists}}`);
-                console.log(`   Tables: ${{detailedMetrics.structure.tables}}`);
-                console.log(`   Forms: ${{detailedMetrics.structure.forms}}`);
-                console.log(`   Interactive Elements: ${{detailedMetrics.structure.buttons + detailedMetrics.structure.inputs}}`);
-                console.log('');
-                
-                // Technical Analysis
-                console.log('⚙️ TECHNICAL ANALYSIS:');
-                console.log(`   Total DOM Elements: ${{detailedMetrics.technical.totalElements.toLocaleString()}}`);
-                console.log(`   JavaScript Files: ${{detailedMetrics.technical.scripts}}`);
-                console.log(`   CSS Stylesheets: ${{detailedMetrics.technical.stylesheets}}`);
-                console.log(`   Viewport: ${{detailedMetrics.technical.viewportWidth}}x${{detailedMetrics.technical.viewportHeight}}`);
-                console.log(`   Screen Resolution: ${{detailedMetrics.technical.screenWidth}}x${{detailedMetrics.technical.screenHeight}}`);
-                console.log(`   Modern Features:`);
-                console.log(`     - Service Worker: ${{detailedMetrics.technical.hasServiceWorker ? '✅' : '❌'}}`);
-                console.log(`     - WebGL: ${{detailedMetrics.technical.hasWebGL ? '✅' : '❌'}}`);
-                console.log(`     - Geolocation: ${{detailedMetrics.technical.hasGeolocation ? '✅' : '❌'}}`);
-                console.log(`     - Local Storage: ${{detailedMetrics.technical.hasLocalStorage ? '✅' : '❌'}}`);
-                console.log('');
-                
-                // Performance Metrics
-                console.log('⚡ PERFORMANCE METRICS:');
-                console.log(`   Total Load Time: ${{detailedMetrics.performance.loadTime}}ms`);
-                console.log(`   DOM Content Loaded: ${{detailedMetrics.performance.domContentLoaded}}ms`);
-                console.log(`   First Paint: ${{detailedMetrics.performance.firstPaint}}ms`);
-                console.log(`   First Contentful Paint: ${{detailedMetrics.performance.firstContentfulPaint}}ms`);
-                console.log('');
-                
-                // SEO Analysis
-                console.log('🔍 SEO ANALYSIS:');
-                console.log(`   Page Title: ${{detailedMetrics.seo.hasTitle ? '✅' : '❌'}} (${{detailedMetrics.seo.titleLength}} chars)`);
-                console.log(`   Meta Description: ${{detailedMetrics.seo.hasMetaDescription ? '✅' : '❌'}}`);
-                console.log(`   Canonical URL: ${{detailedMetrics.seo.hasCanonical ? '✅' : '❌'}}`);
-                console.log(`   Robots Meta: ${{detailedMetrics.seo.hasRobots ? '✅' : '❌'}}`);
-                console.log(`   Structured Data: ${{detailedMetrics.seo.structuredData}} schemas found`);
-                console.log('');
-                
-                // Accessibility Analysis
-                console.log('♿ ACCESSIBILITY ANALYSIS:');
-                console.log(`   Alt Text Coverage: ${{detailedMetrics.accessibility.hasAltTexts ? '✅ Complete' : '❌ Incomplete'}}`);
-                console.log(`   ARIA Labels: ${{detailedMetrics.accessibility.hasAriaLabels}} elements`);
-                console.log(`   Heading Structure: ${{detailedMetrics.accessibility.hasHeadingStructure ? '✅ Present' : '❌ Missing'}}`);
-                console.log(`   Language Attribute: ${{detailedMetrics.accessibility.hasLangAttribute ? '✅ Present' : '❌ Missing'}}`);
-                console.log(`   Focusable Elements: ${{detailedMetrics.accessibility.focusableElements}}`);
-                console.log('');
-                
-                // Calculate quality scores
-                const contentQuality = Math.min(100, (detailedMetrics.content.wordCount / 10));
-                const structureQuality = Math.min(100, (Object.values(detailedMetrics.structure.headings).reduce((a,b) => a+b, 0) * 10));
-                const seoQuality = [
-                    detailedMetrics.seo.hasTitle,
-                    detailedMetrics.seo.hasMetaDescription,
-                    detailedMetrics.seo.titleLength > 10 && detailedMetrics.seo.titleLength < 60
-                ].filter(Boolean).length * 33.33;
-                
-                console.log('📈 QUALITY SCORES:');
-                console.log(`   Content Quality: ${{contentQuality.toFixed(1)}}%`);
-                console.log(`   Structure Quality: ${{structureQuality.toFixed(1)}}%`);
-                console.log(`   SEO Quality: ${{seoQuality.toFixed(1)}}%`);
-                console.log(`   Performance Score: ${{detailedMetrics.performance.loadTime < 3000 ? '✅ Good' : '⚠️ Needs Improvement'}}`);
-                
-                await delay(3000);
-                await browser.close();
-                console.log('🎯 Advanced research analysis completed successfully');
-            """
-        else:
-            script_body = """
-                console.log('📖 Default demo mode');
-                await page.goto('https://example.com');
-                await delay(2000);
-                await browser.close();
-            """
-        
-        return base_config + script_body + "\n} catch(error) { console.error('❌ Error:', error.message); process.exit(1); } })();"
+        urls = kwargs.get("urls") or [kwargs.get("url", "https://example.com")]
+        return _build_script(action, tuple(urls), kwargs.get("screenshot_format", "jpeg"))
     
     @staticmethod
-    def execute_script(node_path: str, script: str) -> Dict[str, any]:
-        """Enhanced script execution with detailed monitoring and extended timeout"""
-        script_file = 'temp_automation.js'
-        
+    def parse_message(line: str) -> Optional[Dict]:
+        """Decode a JSON message line emitted by the node worker"""
+        if not line.startswith('{'):
+            return None
         try:
-            with open(script_file, 'w', encoding='utf-8') as f:
-                f.write(script)
+            return orjson.loads(line) if orjson else json.loads(line)
+        except ValueError:
+            return None
+    
+    @staticmethod
+    def execute_script(node_path: str, script: str, on_log: Optional[Callable[[str], None]] = None,
+                       cancel: Optional[threading.Event] = None) -> Dict[str, any]:
+        """Enhanced script execution with live output streaming and extended timeout"""
+        try:
+            # Scripts run inside a pooled persistent node worker - no node
+            # or Puppeteer start-up per click, and no temp file on disk
+            with _node_worker(node_path, cancel) as worker:
+                ok, messages = worker.run(script, _browser_endpoint(node_path), on_log, cancel)
             
-            # Execute with extended timeout and detailed error capture
-            result = subprocess.run([node_path, script_file], 
-                                  capture_output=True, text=True, 
-                                  timeout=CONFIG["timeout"], encoding='utf-8')
+            # Each analysed page arrives as a report message; format them here
+            reports = []
+            output_lines = []
+            error_lines = []
+            screenshot = None
+            for message in messages:
+                if message["type"] == "report":
+                    reports.append(message["data"])
+                    output_lines.append(_REPORT_FORMATTERS[message["action"]](message["data"]))
+                elif message["type"] == "screenshot":
+                    screenshot = message["path"]
+                elif message["type"] == "stderr":
+                    error_lines.append(message["line"])
+                elif message["type"] == "error":
+                    error_lines.append(f"❌ Error: {message['message']}")
+                elif message["type"] == "log":
+                    output_lines.append(message["line"])
+            stdout = '\n'.join(output_lines)
+            stderr = '\n'.join(error_lines)
+            return_code = 0 if ok else 1
             
             return {
-                "success": result.returncode == 0,
-                "output": result.stdout,
-                "error": result.stderr if result.stderr else None,
-                "return_code": result.returncode,
+                "success": ok,
+                "output": stdout,
+                "reports": reports,
+                "error": stderr if stderr else None,
+                "return_code": return_code,
                 "execution_time": "Completed within timeout",
                 "details": {
-                    "stdout_lines": len(result.stdout.splitlines()) if result.stdout else 0,
-                    "stderr_lines": len(result.stderr.splitlines()) if result.stderr else 0,
-                    "total_output_chars": len(result.stdout) + len(result.stderr or "")
+                    "stdout_lines": len(stdout.splitlines()),
+                    "stderr_lines": len(stderr.splitlines()),
+                    "total_output_chars": len(stdout) + len(stderr),
+                    "screenshot": screenshot
                 }
             }
             
-        except subprocess.TimeoutExpired:
+        except TimeoutError:
             return {
                 "success": False, 
                 "error": f"Execution timeout after {CONFIG['timeout']} seconds - process was terminated for safety",
                 "execution_time": f"Exceeded {CONFIG['timeout']}s timeout",
                 "details": {"timeout_reason": "Process took longer than expected - may indicate network issues or complex page loading"}
             }
+        except InterruptedError:
+            return {
+                "success": False,
+                "error": "Execution cancelled by user",
+                "execution_time": "Cancelled",
+                "details": {"cancel_reason": "Cancel requested from the sidebar"}
+            }
         except Exception as e:
             return {
                 "success": False, 
                 "error": f"Execution error: {str(e)}",
                 "details": {"exception_type": type(e).__name__, "exception_message": str(e)}
             }
-        finally:
-            try: 
-                os.remove(script_file)
-            except: 
-                pass
+
+class NodeWorker:
+    """Long-lived `node worker.js` process that runs generated scripts over NDJSON"""
+    
+    def __init__(self, node_path: str):
+        # Own session/process group so a timeout can take down every descendant
+        self.proc = subprocess.Popen([node_path, str(_WORKER_JS)],
+                                     stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                     stderr=subprocess.PIPE, text=True, encoding='utf-8',
+                                     errors='replace', bufsize=1,
+                                     env=dict(os.environ, FORCE_COLOR='0'),
+                                     start_new_session=(os.name != 'nt'),
+                                     creationflags=(subprocess.CREATE_NEW_PROCESS_GROUP
+                                                    if os.name == 'nt' else 0))
+        self.lines = queue.Queue()
+        self.stderr_tail = collections.deque(maxlen=50)
+        self.last_id = 0
+        
+        # Reader threads hold only the pipes, so an abandoned worker can still be
+        # garbage collected; the finalizer then (or at interpreter exit) kills it
+        threading.Thread(target=_pump_lines, args=(self.proc.stdout, self.lines.put), daemon=True).start()
+        self.stderr_reader = threading.Thread(target=_pump_lines, args=(self.proc.stderr, self.stderr_tail.append),
+                                              daemon=True)
+        self.stderr_reader.start()
+        weakref.finalize(self, _kill_process_tree, self.proc)
+    
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+    
+    def _exit_error(self) -> Dict:
+        """Error message for a worker that has died, carrying the tail of its stderr"""
+        self.proc.wait()
+        self.stderr_reader.join(timeout=1)  # Let the last stderr lines land
+        crash = '\n'.join(filter(None, self.stderr_tail)) or f"exit code {self.proc.returncode}"
+        return {"type": "error", "message": f"Node worker exited: {crash}"}
+    
+    def run(self, script: str, ws_endpoint: str, on_log: Optional[Callable[[str], None]] = None,
+            cancel: Optional[threading.Event] = None) -> Tuple[bool, List[Dict]]:
+        """Send one script to the worker and collect its messages until it reports done"""
+        self.last_id += 1
+        command = {"op": "run", "id": self.last_id, "script": script, "ws": ws_endpoint}
+        try:
+            self.proc.stdin.write(json.dumps(command) + '\n')
+            self.proc.stdin.flush()
+        except OSError:  # Died before taking the command (e.g. puppeteer not resolvable)
+            return False, [self._exit_error()]
+        
+        deadline = time.monotonic() + CONFIG["timeout"]
+        messages = []
+        while True:
+            # Stopping the worker (it is respawned on next use) is the only way to
+            # abort a script mid-flight; it closes its browser context on SIGTERM
+            if cancel is not None and cancel.is_set():
+                _terminate_process_tree(self.proc)
+                raise InterruptedError("Run cancelled")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                _terminate_process_tree(self.proc)
+                raise TimeoutError(f"Script exceeded {CONFIG['timeout']}s")
+            
+            try:
+                line = self.lines.get(timeout=min(remaining, 0.1))
+            except queue.Empty:
+                continue
+            
+            if line is None:  # Worker died mid-run
+                messages.append(self._exit_error())
+                return False, messages
+            
+            message = PuppeteerManager.parse_message(line)
+            if not message or message.get("id") != self.last_id:
+                continue  # Stray output, or a late message from an earlier command
+            
+            if message["type"] == "done":
+                if not message["ok"]:
+                    messages.append({"type": "error", "message": message["error"]})
+                return message["ok"], messages
+            
+            messages.append(message)
+            if message["type"] == "log" and on_log is not None:
+                on_log(message["line"])
+
+def _pump_lines(stream, sink) -> None:
+    """Forward a pipe line by line to `sink`, then None at EOF"""
+    for line in stream:
+        sink(line.rstrip('\n'))
+    sink(None)
+
+@st.cache_resource(show_spinner=False)
+def _worker_pool(node_path: str) -> queue.Queue:
+    """Process-wide pool of node worker slots shared by every session"""
+    pool = queue.Queue()
+    for _ in range(CONFIG["worker_pool_size"]):
+        pool.put(None)  # Workers are spawned on first use of their slot
+    return pool
+
+@contextlib.contextmanager
+def _node_worker(node_path: str, cancel: Optional[threading.Event] = None):
+    """Borrow a free worker from the pool, (re)spawning it if needed, and always return it"""
+    pool = _worker_pool(node_path)
+    while True:
+        # A run cancelled while waiting for a worker stops here, before any process is touched
+        if cancel is not None and cancel.is_set():
+            raise InterruptedError("Run cancelled")
+        try:
+            worker = pool.get(timeout=0.1)
+            break
+        except queue.Empty:
+            pass
+    try:
+        if cancel is not None and cancel.is_set():
+            raise InterruptedError("Run cancelled")
+        if worker is None or not worker.alive():
+            worker = NodeWorker(node_path)
+        yield worker
+    finally:
+        pool.put(worker)
+
+def _terminate_process_tree(proc, grace: float = 2.0) -> None:
+    """Ask a child's process group to exit, killing it if it is still around after `grace` s"""
+    if os.name != 'nt':
+        try:
+            os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
+            proc.wait(timeout=grace)
+            return
+        except ProcessLookupError:
+            return  # Already exited
+        except subprocess.TimeoutExpired:
+            pass
+    _kill_process_tree(proc)
+    proc.wait()  # Reap it so the next run spawns a fresh worker
+
+def _kill_process_tree(proc) -> None:
+    """Kill a child started in its own process group, grandchildren included"""
+    if proc.poll() is not None:
+        return  # Already reaped: its PID (and group id) may belong to another process now
+    try:
+        if os.name == 'nt':
+            proc.send_signal(signal.CTRL_BREAK_EVENT)
+            proc.kill()
+        else:
+            os.killpg(os.getpgid(proc.pid), signal.SIGKILL)
+    except ProcessLookupError:
+        pass  # Already exited
+
+@st.cache_resource(show_spinner=False)
+def _sidecars() -> Tuple[threading.Lock, Dict[str, Tuple[subprocess.Popen, str]]]:
+    """Process-wide shared browsers by node path: (sidecar, wsEndpoint)"""
+    # Executor threads may all find a dead sidecar at once; check-and-relaunch
+    # holds the lock so exactly one replacement is launched and kept
+    return threading.Lock(), {}
+
+def _launch_sidecar(node_path: str) -> Tuple[subprocess.Popen, str]:
+    """Launch the shared browser and return (sidecar, wsEndpoint)"""
+    proc = subprocess.Popen([node_path, '-e', _BROWSER_SIDECAR_JS],
+                            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE, text=True, encoding='utf-8',
+                            errors='replace', env=dict(os.environ, FORCE_COLOR='0'))
+    atexit.register(proc.terminate)
+    
+    endpoint = proc.stdout.readline().strip()
+    if not endpoint:
+        proc.wait()
+        raise RuntimeError(f"Browser sidecar failed to start: {proc.stderr.read().strip()}")
+    return proc, endpoint
+
+def _browser_endpoint(node_path: str) -> str:
+    """WebSocket endpoint of the shared browser, relaunching it if the sidecar died"""
+    lock, sidecars = _sidecars()
+    with lock:
+        sidecar = sidecars.get(node_path)
+        if sidecar is None or sidecar[0].poll() is not None:
+            sidecar = sidecars[node_path] = _launch_sidecar(node_path)
+    return sidecar[1]
+
+def _restart_browser(node_path: str) -> bool:
+    """Close the shared browser, if one is running; the next run launches a fresh one"""
+    lock, sidecars = _sidecars()
+    with lock:
+        sidecar = sidecars.pop(node_path, None)
+    if sidecar is None or sidecar[0].poll() is not None:
+        return False
+    
+    proc = sidecar[0]
+    proc.stdin.close()  # Sidecar closes the browser on stdin EOF
+    try:
+        proc.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+    return True
+
+@st.cache_data(ttl=2, show_spinner=False)
+def _latest_demo_screenshot() -> Optional[str]:
+    """Newest academic_demo_* screenshot on disk, for runs that didn't report one"""
+    shots = [p for pattern in ('academic_demo_*.png', 'academic_demo_*.jpg') for p in Path('.').glob(pattern)]
+    return max(shots, key=lambda p: p.stat().st_mtime).name if shots else None
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _read_bytes(path: str, mtime: float) -> bytes:
+    """File contents, cached per (path, mtime) so a rewritten file is read again"""
+    return Path(path).read_bytes()
+
+@st.cache_resource(show_spinner=False)
+def _result_cache() -> Tuple[threading.Lock, Dict[str, Tuple[float, Dict[str, any]]]]:
+    """Process-wide store of successful runs: script digest -> (timestamp, result)"""
+    # Executor threads of every session share it, so all access holds the lock
+    return threading.Lock(), {}
+
+def _run_cached(node_path: str, script: str, on_log: Optional[Callable[[str], None]] = None,
+                cancel: Optional[threading.Event] = None) -> Dict[str, any]:
+    """Run a script, reusing a successful result for the identical script within the TTL"""
+    # Hand-rolled rather than st.cache_data: it runs on a background thread, and
+    # a cache hit must not depend on (or replay into) the live-log callback
+    key = hashlib.blake2b(f"{node_path}\0{script}".encode('utf-8')).hexdigest()
+    (lock, cache), now = _result_cache(), time.monotonic()
+    with lock:
+        hit = cache.get(key)
+    if hit and now - hit[0] < CONFIG["result_cache_ttl"]:
+        return hit[1]
+    
+    result = PuppeteerManager.execute_script(node_path, script, on_log, cancel)
+    if result["success"]:  # Failures (timeouts, network errors) are always retried
+        with lock:
+            for stale in [k for k, (stamp, _) in cache.items() if now - stamp >= CONFIG["result_cache_ttl"]]:
+                cache.pop(stale, None)
+            cache[key] = (time.monotonic(), result)
+    return result
+
+@st.cache_resource
+def _executor() -> ThreadPoolExecutor:
+    """Threads that run automation so the script thread stays free to redraw the UI"""
+    return ThreadPoolExecutor(max_workers=CONFIG["worker_pool_size"])
+
+def _start_run(key: str, labels: Tuple[str, str, str], run: Callable, *args) -> None:
+    """Submit run(*args, on_log, cancel) in the background, tracked in session_state.runs[key]"""
+    runs = st.session_state.setdefault("runs", {})
+    if key in runs:  # Already running; a rerun mustn't start it twice
+        return
+    log_lines, cancel = [], threading.Event()
+    future = _executor().submit(run, *args, log_lines.append, cancel)
+    runs[key] = (future, log_lines, labels, time.monotonic(), cancel)
+
+def _cancel_runs() -> int:
+    """Signal every background run of this session to stop; returns how many there were"""
+    runs = st.session_state.get("runs", {})
+    for future, *_, cancel in runs.values():
+        future.cancel()  # Still queued in the executor: it never starts
+        cancel.set()  # Already started: it stops at its next check
+    return len(runs)
+
+def _watch_run(key: str) -> Optional[Dict[str, any]]:
+    """Follow a background run in an st.status panel; returns its result once finished"""
+    pending = st.session_state.get("runs", {}).get(key)
+    if pending is None:
+        return None
+    
+    future, log_lines, (running, finished, failed), started, _ = pending
+    with st.status(running, expanded=True) as status:
+        live_output = st.empty()
+        # Poll at 100 ms: live enough for progress, no busy-wait on the script thread.
+        # Only send a delta when the elapsed second or the log actually changed
+        shown_seconds, shown_lines = None, None
+        while not future.done():
+            seconds = int(time.monotonic() - started)
+            if seconds != shown_seconds:
+                status.update(label=f"{running} {seconds}s")
+                shown_seconds = seconds
+            if len(log_lines) != shown_lines:
+                shown_lines = len(log_lines)
+                live_output.text('\n'.join(log_lines[:shown_lines]))
+            time.sleep(0.1)
+        if len(log_lines) != shown_lines:
+            live_output.text('\n'.join(log_lines))
+        
+        # Drop the entry before reading the outcome, so a run that raised
+        # doesn't re-raise on every rerun and block new runs of this panel
+        del st.session_state.runs[key]
+        try:
+            result = future.result()
+        except CancelledError:
+            result = {
+                "success": False,
+                "error": "Execution cancelled by user",
+                "execution_time": "Cancelled",
+                "details": {"cancel_reason": "Cancel requested from the sidebar"}
+            }
+        except Exception as e:
+            result = {
+                "success": False,
+                "error": f"Execution error: {str(e)}",
+                "details": {"exception_type": type(e).__name__, "exception_message": str(e)}
+            }
+        status.update(label=finished if result["success"] else failed,
+                      state="complete" if result["success"] else "error", expanded=False)
+    return result
+
+# Static page copy
+_ACADEMIC_CONTEXT_MD = """
+**Primary Learning Objectives:**
+- Understand inter-process communication between Python and Node.js
+- Demonstrate browser automation for research and testing
+- Implement proper error handling and user feedback systems
+- Practice cross-platform development considerations
+
+**Technical Stack:** Python (Streamlit) + Node.js (Puppeteer) + Subprocess Communication
+"""
+
+_TECH_DOCS_MD = """
+**🎯 Analysis Capabilities:**
+
+**1. Comprehensive Web Analysis:**
+- Content metrics (word count, reading time, link analysis)
+- Structure analysis (heading hierarchy, DOM elements)
+- Performance monitoring (load times, paint metrics)
+- SEO evaluation (meta tags, structured data)
+- Accessibility assessment (ARIA labels, alt texts)
+
+**2. Technical Architecture:**
+- **Inter-Process Communication**: Python orchestrates Node.js subprocess
+- **Dynamic Code Generation**: JavaScript automation scripts created programmatically  
+- **Cross-Platform Compatibility**: Automatic executable detection and path resolution
+- **Real-Time Feedback**: Live progress updates and error handling
+- **Extended Timeout Management**: 5-minute execution limit for complex analyses
+
+**3. Academic Applications:**
+- **Digital Humanities**: Automated content analysis of historical websites
+- **Media Studies**: Social media platform structure analysis
+- **Computer Science**: Web performance benchmarking and optimization studies
+- **Information Science**: SEO and accessibility compliance research
+
+**4. Industry Relevance:**
+- Quality Assurance automation principles
+- Web scraping for data science applications
+- Performance monitoring and optimization
+- Accessibility compliance testing
+"""
+
+_SHOWCASE_MD = """
+**Key Technical Achievements:**
+
+✅ **Cross-Language Integration**: Seamless Python-Node.js communication  
+✅ **Dynamic Script Generation**: Runtime JavaScript code creation  
+✅ **Robust Error Handling**: Comprehensive timeout and exception management  
+✅ **Academic Focus**: Research-oriented automation with detailed analytics  
+✅ **Professional Documentation**: Clean code with comprehensive explanations  
+✅ **Real-World Application**: Industry-standard automation principles  
+✅ **Educational Value**: Clear learning objectives and technical explanations  
+
+**Demonstrates Mastery Of:**
+- Modern web automation frameworks (Puppeteer)
+- Python web application development (Streamlit)
+- Subprocess management and inter-process communication
+- Cross-platform development considerations
+- User experience design for technical applications
+- Academic research tool development
+"""
+
+# CONFIG is fixed at import, so its summary is formatted once rather than per rerun
+_CONFIG_BLOCK = f"""
+Execution Timeout: {CONFIG['timeout']} seconds
+Analysis Timeout: {CONFIG['analysis_timeout']/1000} seconds
+Installation Timeout: {CONFIG['installation_timeout']} seconds
+Viewport: {CONFIG['viewport']['width']}x{CONFIG['viewport']['height']}
+"""
+
+_FOOTER_COLUMNS = (
+    ("**🎓 Educational Value**",
+     ("- Inter-language communication", "- Browser automation principles", "- Real-time system feedback")),
+    ("**🔬 Research Applications**",
+     ("- Web content analysis", "- Performance benchmarking", "- Accessibility evaluation")),
+    ("**💼 Industry Relevance**",
+     ("- QA automation practices", "- Web scraping methodologies", "- Performance monitoring")),
+)
 
 # Streamlit Application
+@st.fragment
+def _demo_panel(node_path: str) -> None:
+    """Academic demo column; its widgets rerun only this fragment"""
+    st.markdown("### 🎯 Academic Demo")
+    st.markdown("Demonstrates automated navigation to Google Scholar with analysis")
+    lossless = st.toggle("Lossless PNG screenshot", value=False,
+                         help="JPEG (quality 80) encodes much faster and is far smaller")
+    
+    if st.button("🚀 Run Academic Demo", type="primary"):
+        script = PuppeteerManager.create_script("demo", screenshot_format="png" if lossless else "jpeg")
+        _start_run("demo_run",
+                   ("Executing browser automation...", "Browser automation finished", "Browser automation failed"),
+                   PuppeteerManager.execute_script, node_path, script)
+    
+    finished = _watch_run("demo_run")
+    if finished is not None:
+        st.session_state.demo_result = finished
+    
+    # Drawn from session state so the last run survives unrelated reruns
+    result = st.session_state.get("demo_result")
+    if result:
+        if result["success"]:
+            st.success("✅ Demo executed successfully!")
+            
+            # Display execution metrics
+            with st.expander("📊 Execution Metrics"):
+                col1_metrics, col2_metrics = st.columns(2)
+                with col1_metrics:
+                    st.metric("Output Lines", result["details"]["stdout_lines"])
+                    st.metric("Return Code", result["return_code"])
+                with col2_metrics:
+                    st.metric("Total Characters", result["details"]["total_output_chars"])
+                    st.metric("Execution Status", result["execution_time"])
+            
+            # Display detailed output
+            st.markdown("### 📋 Detailed Analysis Output")
+            st.code(result["output"], language="text")
+            
+            if result["reports"]:
+                with st.expander("🧾 Structured Report Data"):
+                    st.json(result["reports"][0])
+            
+            # Show screenshot if available - the run reports its own path
+            latest_screenshot = result["details"]["screenshot"] or _latest_demo_screenshot()
+            if latest_screenshot and os.path.isfile(latest_screenshot):
+                # One cached read serves both the preview and the download
+                image_bytes = _read_bytes(latest_screenshot, os.path.getmtime(latest_screenshot))
+                st.image(image_bytes, caption=f"Academic Demo Screenshot: {latest_screenshot}", width=600)
+                
+                # Provide download option
+                st.download_button(
+                    label="📥 Download Screenshot",
+                    data=image_bytes,
+                    file_name=latest_screenshot,
+                    mime="image/jpeg" if latest_screenshot.endswith('.jpg') else "image/png"
+                )
+        else:
+            st.error("❌ Execution failed")
+            st.error(result["error"])
+            
+            # Show detailed error information
+            if "details" in result:
+                with st.expander("🔍 Error Details"):
+                    st.json(result["details"])
+
+@st.fragment
+def _research_panel(node_path: str) -> None:
+    """Research column; its widgets rerun only this fragment"""
+    st.markdown("### 🔬 Research Analysis")
+    st.markdown("Automated website analysis with metrics collection")
+    
+    url_text = st.text_area("Research Target URLs (one per line):", 
+                            value="https://wikipedia.org", 
+                            key="research_url")
+    urls = [line.strip() for line in url_text.splitlines() if line.strip()]
+    
+    if st.button("📊 Analyze Website"):
+        if urls:
+            script = PuppeteerManager.create_script("research", urls=urls)
+            _start_run("research_run", (f"Analyzing {', '.join(urls)}...", "Analysis finished", "Analysis failed"),
+                       _run_cached, node_path, script)
+        else:
+            st.warning("Please enter at least one URL to analyze")
+    
+    finished = _watch_run("research_run")
+    if finished is not None:
+        st.session_state.research_result = finished
+    
+    result = st.session_state.get("research_result")
+    if result:
+        if result["success"]:
+            st.success("✅ Analysis completed!")
+            
+            # Sites that failed inside an otherwise successful batch
+            if result["error"]:
+                st.warning(result["error"])
+            
+            # Key metrics dashboard: one table row per analysed site
+            st.markdown("### 📊 Key Metrics Dashboard")
+            # Raw numbers so the columns sort numerically; column_config formats them
+            st.dataframe([{
+                "URL": report['basic']['url'],
+                "Word Count": report['content']['wordCount'],
+                "Total Links": report['content']['totalLinks'],
+                "Load Time": report['performance']['loadTime'],
+                "DOM Elements": report['technical']['totalElements']
+            } for report in result["reports"]], hide_index=True, column_config={
+                "Word Count": st.column_config.NumberColumn(format="localized"),
+                "Total Links": st.column_config.NumberColumn(format="%d"),
+                "Load Time": st.column_config.NumberColumn(format="%d ms"),
+                "DOM Elements": st.column_config.NumberColumn(format="localized")
+            })
+            
+            # Display full analysis
+            with st.expander("📋 Complete Analysis Report"):
+                st.code(result["output"], language="text")
+            
+            if result["reports"]:
+                with st.expander("🧾 Structured Report Data"):
+                    st.json(result["reports"])
+            
+            # Display execution details
+            with st.expander("⚙️ Execution Details"):
+                col1_exec, col2_exec = st.columns(2)
+                with col1_exec:
+                    st.metric("Output Lines", result["details"]["stdout_lines"])
+                    st.metric("Analysis Depth", "Advanced" if result["details"]["stdout_lines"] > 50 else "Basic")
+                with col2_exec:
+                    st.metric("Total Output Size", f"{result['details']['total_output_chars']:,} chars")
+                    st.metric("Execution Time", result["execution_time"])
+        else:
+            st.error("❌ Analysis failed")
+            st.error(result["error"])
+            
+            # Enhanced error reporting
+            if "details" in result:
+                with st.expander("🔍 Diagnostic Information"):
+                    st.json(result["details"])
+                    
+                    if "timeout" in result["error"].lower():
+                        st.warning("💡 **Tip**: Try a simpler URL or check your internet connection. Some sites may take longer to load.")
+                    elif "network" in result["error"].lower():
+                        st.warning("💡 **Tip**: Check if the URL is accessible and your internet connection is stable.")
+
 def main():
     st.set_page_config(page_title=CONFIG["app_title"], layout="wide", 
                        initial_sidebar_state="expanded")
@@ -580,15 +1213,7 @@ def main():
     
     # Academic Context
     with st.expander("📚 Academic Context & Learning Objectives"):
-        st.markdown("""
-        **Primary Learning Objectives:**
-        - Understand inter-process communication between Python and Node.js
-        - Demonstrate browser automation for research and testing
-        - Implement proper error handling and user feedback systems
-        - Practice cross-platform development considerations
-        
-        **Technical Stack:** Python (Streamlit) + Node.js (Puppeteer) + Subprocess Communication
-        """)
+        st.markdown(_ACADEMIC_CONTEXT_MD)
     
     # System Validation
     with st.sidebar:
@@ -609,248 +1234,81 @@ def main():
                     st.success("✅ " + result["message"])
                 else:
                     st.error("❌ " + result["message"])
+            
+            if st.button("Clear analysis cache"):
+                lock, cache = _result_cache()
+                with lock:
+                    cache.clear()
+                st.success("✅ Cached analysis results cleared")
+            
+            if st.button("Restart browser"):
+                try:
+                    if _restart_browser(node_path):
+                        st.success("✅ Browser restarted")
+                    else:
+                        st.info("No browser running")
+                except OSError as e:
+                    st.error(f"❌ Browser restart failed: {e}")
+            
+            # Lives outside the panel fragments: a click there would only queue behind
+            # the running fragment, while a full rerun interrupts it straight away
+            if st.button("⏹ Cancel running automation"):
+                if _cancel_runs():
+                    st.success("✅ Cancellation requested")
+                else:
+                    st.info("Nothing is running")
         else:
             st.error("❌ Node.js not found")
             st.markdown("Please install Node.js to continue")
             return
     
     # Main Interface
-    if is_valid and Path('node_modules').exists():
+    if is_valid and _puppeteer_installed():
         
         col1, col2 = st.columns(2)
         
         with col1:
-            st.markdown("### 🎯 Academic Demo")
-            st.markdown("Demonstrates automated navigation to Google Scholar with analysis")
-            
-            if st.button("🚀 Run Academic Demo", type="primary"):
-                with st.spinner("Executing browser automation..."):
-                    script = PuppeteerManager.create_script("demo")
-                    result = PuppeteerManager.execute_script(node_path, script)
-                
-                if result["success"]:
-                    st.success("✅ Demo executed successfully!")
-                    
-                    # Display execution metrics
-                    with st.expander("📊 Execution Metrics"):
-                        col1_metrics, col2_metrics = st.columns(2)
-                        with col1_metrics:
-                            st.metric("Output Lines", result["details"]["stdout_lines"])
-                            st.metric("Return Code", result["return_code"])
-                        with col2_metrics:
-                            st.metric("Total Characters", result["details"]["total_output_chars"])
-                            st.metric("Execution Status", result["execution_time"])
-                    
-                    # Display detailed output
-                    st.markdown("### 📋 Detailed Analysis Output")
-                    st.code(result["output"], language="text")
-                    
-                    # Show screenshot if available
-                    screenshot_files = [f for f in os.listdir('.') if f.startswith('academic_demo_') and f.endswith('.png')]
-                    if screenshot_files:
-                        latest_screenshot = max(screenshot_files, key=os.path.getctime)
-                        st.image(latest_screenshot, caption=f"Academic Demo Screenshot: {latest_screenshot}", width=600)
-                        
-                        # Provide download option
-                        with open(latest_screenshot, "rb") as file:
-                            st.download_button(
-                                label="📥 Download Screenshot",
-                                data=file.read(),
-                                file_name=latest_screenshot,
-                                mime="image/png"
-                            )
-                else:
-                    st.error("❌ Execution failed")
-                    st.error(result["error"])
-                    
-                    # Show detailed error information
-                    if "details" in result:
-                        with st.expander("🔍 Error Details"):
-                            st.json(result["details"])
+            _demo_panel(node_path)
         
         with col2:
-            st.markdown("### 🔬 Research Analysis")
-            st.markdown("Automated website analysis with metrics collection")
-            
-            url = st.text_input("Research Target URL:", 
-                              value="https://wikipedia.org", 
-                              key="research_url")
-            
-            if st.button("📊 Analyze Website"):
-                if url:
-                    with st.spinner(f"Analyzing {url}..."):
-                        script = PuppeteerManager.create_script("research", url=url)
-                        result = PuppeteerManager.execute_script(node_path, script)
-                    
-                    if result["success"]:
-                        st.success("✅ Analysis completed!")
-                        
-                        # Parse and display structured results
-                        output_lines = result["output"].split('\n')
-                        
-                        # Extract key metrics for dashboard
-                        metrics_data = {}
-                        for line in output_lines:
-                            if 'Word Count:' in line:
-                                metrics_data['words'] = line.split(':')[1].strip().split()[0].replace(',', '')
-                            elif 'Total Links:' in line:
-                                metrics_data['links'] = line.split(':')[1].strip()
-                            elif 'Total Load Time:' in line:
-                                metrics_data['load_time'] = line.split(':')[1].strip().replace('ms', '')
-                            elif 'Total DOM Elements:' in line:
-                                metrics_data['elements'] = line.split(':')[1].strip().replace(',', '')
-                        
-                        # Display key metrics dashboard
-                        if metrics_data:
-                            st.markdown("### 📊 Key Metrics Dashboard")
-                            col1_dash, col2_dash, col3_dash, col4_dash = st.columns(4)
-                            
-                            with col1_dash:
-                                if 'words' in metrics_data:
-                                    st.metric("Word Count", f"{int(metrics_data['words']):,}")
-                            
-                            with col2_dash:
-                                if 'links' in metrics_data:
-                                    st.metric("Total Links", metrics_data['links'])
-                            
-                            with col3_dash:
-                                if 'load_time' in metrics_data:
-                                    st.metric("Load Time", f"{metrics_data['load_time']}ms")
-                            
-                            with col4_dash:
-                                if 'elements' in metrics_data:
-                                    st.metric("DOM Elements", f"{int(metrics_data['elements']):,}")
-                        
-                        # Display full analysis
-                        with st.expander("📋 Complete Analysis Report"):
-                            st.code(result["output"], language="text")
-                        
-                        # Display execution details
-                        with st.expander("⚙️ Execution Details"):
-                            col1_exec, col2_exec = st.columns(2)
-                            with col1_exec:
-                                st.metric("Output Lines", result["details"]["stdout_lines"])
-                                st.metric("Analysis Depth", "Advanced" if result["details"]["stdout_lines"] > 50 else "Basic")
-                            with col2_exec:
-                                st.metric("Total Output Size", f"{result['details']['total_output_chars']:,} chars")
-                                st.metric("Execution Time", result["execution_time"])
-                    else:
-                        st.error("❌ Analysis failed")
-                        st.error(result["error"])
-                        
-                        # Enhanced error reporting
-                        if "details" in result:
-                            with st.expander("🔍 Diagnostic Information"):
-                                st.json(result["details"])
-                                
-                                if "timeout" in result["error"].lower():
-                                    st.warning("💡 **Tip**: Try a simpler URL or check your internet connection. Some sites may take longer to load.")
-                                elif "network" in result["error"].lower():
-                                    st.warning("💡 **Tip**: Check if the URL is accessible and your internet connection is stable.")
-                else:
-                    st.warning("Please enter a URL to analyze")
+            _research_panel(node_path)
     
     elif is_valid:
         st.info("📦 Please install Puppeteer using the sidebar to begin")
     
     # Advanced Technical Analysis Section
     st.markdown("---")
-    if is_valid and Path('node_modules').exists():
+    if is_valid and _puppeteer_installed():
         st.markdown("### 🔬 Advanced Analysis Features")
         
         with st.expander("📚 Technical Documentation & Learning Resources"):
-            st.markdown("""
-            **🎯 Analysis Capabilities:**
-            
-            **1. Comprehensive Web Analysis:**
-            - Content metrics (word count, reading time, link analysis)
-            - Structure analysis (heading hierarchy, DOM elements)
-            - Performance monitoring (load times, paint metrics)
-            - SEO evaluation (meta tags, structured data)
-            - Accessibility assessment (ARIA labels, alt texts)
-            
-            **2. Technical Architecture:**
-            - **Inter-Process Communication**: Python orchestrates Node.js subprocess
-            - **Dynamic Code Generation**: JavaScript automation scripts created programmatically  
-            - **Cross-Platform Compatibility**: Automatic executable detection and path resolution
-            - **Real-Time Feedback**: Live progress updates and error handling
-            - **Extended Timeout Management**: 5-minute execution limit for complex analyses
-            
-            **3. Academic Applications:**
-            - **Digital Humanities**: Automated content analysis of historical websites
-            - **Media Studies**: Social media platform structure analysis
-            - **Computer Science**: Web performance benchmarking and optimization studies
-            - **Information Science**: SEO and accessibility compliance research
-            
-            **4. Industry Relevance:**
-            - Quality Assurance automation principles
-            - Web scraping for data science applications
-            - Performance monitoring and optimization
-            - Accessibility compliance testing
-            """)
+            st.markdown(_TECH_DOCS_MD)
         
         with st.expander("⚙️ System Configuration & Performance"):
             st.markdown("**Current Configuration:**")
             config_col1, config_col2 = st.columns(2)
             
             with config_col1:
-                st.code(f"""
-Execution Timeout: {CONFIG['timeout']} seconds
-Analysis Timeout: {CONFIG['analysis_timeout']/1000} seconds
-Installation Timeout: {CONFIG['installation_timeout']} seconds
-Viewport: {CONFIG['viewport']['width']}x{CONFIG['viewport']['height']}
-                """)
+                st.code(_CONFIG_BLOCK)
             
             with config_col2:
                 st.markdown("**Performance Optimizations:**")
                 st.markdown("- Extended timeouts for complex sites")
                 st.markdown("- Full-page screenshot capabilities") 
-                st.markdown("- Network idle detection")
+                st.markdown("- Headless browser with lean launch flags")
                 st.markdown("- Comprehensive error reporting")
                 st.markdown("- Memory-efficient subprocess management")
         
         with st.expander("🏆 Project Showcase Points"):
-            st.markdown("""
-            **Key Technical Achievements:**
-            
-            ✅ **Cross-Language Integration**: Seamless Python-Node.js communication  
-            ✅ **Dynamic Script Generation**: Runtime JavaScript code creation  
-            ✅ **Robust Error Handling**: Comprehensive timeout and exception management  
-            ✅ **Academic Focus**: Research-oriented automation with detailed analytics  
-            ✅ **Professional Documentation**: Clean code with comprehensive explanations  
-            ✅ **Real-World Application**: Industry-standard automation principles  
-            ✅ **Educational Value**: Clear learning objectives and technical explanations  
-            
-            **Demonstrates Mastery Of:**
-            - Modern web automation frameworks (Puppeteer)
-            - Python web application development (Streamlit)
-            - Subprocess management and inter-process communication
-            - Cross-platform development considerations
-            - User experience design for technical applications
-            - Academic research tool development
-            """)
+            st.markdown(_SHOWCASE_MD)
     
     # Footer with academic context
     st.markdown("---")
-    footer_col1, footer_col2, footer_col3 = st.columns(3)
-    
-    with footer_col1:
-        st.markdown("**🎓 Educational Value**")
-        st.markdown("- Inter-language communication")
-        st.markdown("- Browser automation principles") 
-        st.markdown("- Real-time system feedback")
-    
-    with footer_col2:
-        st.markdown("**🔬 Research Applications**")
-        st.markdown("- Web content analysis")
-        st.markdown("- Performance benchmarking")
-        st.markdown("- Accessibility evaluation")
-    
-    with footer_col3:
-        st.markdown("**💼 Industry Relevance**")
-        st.markdown("- QA automation practices")
-        st.markdown("- Web scraping methodologies")
-        st.markdown("- Performance monitoring")
+    for footer_col, (heading, points) in zip(st.columns(3), _FOOTER_COLUMNS):
+        with footer_col:
+            st.markdown(heading)
+            for point in points:
+                st.markdown(point)
     
     st.markdown("*Built for academic demonstration of modern web automation principles with industry-standard practices*")
 
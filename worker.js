@@ -0,0 +1,104 @@
+/*
+ * Persistent automation worker for main.py
+ *
+ * Keeps Node.js, Puppeteer and the browser connection warm across runs.
+ * Commands arrive on stdin as one JSON object per line:
+ *
+ *     {"op": "run", "id": 1, "script": "<async function body>", "ws": "<browserWSEndpoint>"}
+ *
+ * The script body runs with `browser`, `console` and `emit` in scope, where
+ * `browser` is a fresh incognito context of the shared browser. Every
+ * message back to Python is one JSON line on stdout tagged with the command id:
+ * {type: 'log' | 'stderr', line}, anything passed to emit(), and finally
+ * {type: 'done', ok, error?}.
+ */
+const readline = require('readline');
+const util = require('util');
+
+// Resolve puppeteer from the working directory, where ensure_installation runs npm
+const puppeteer = require(require.resolve('puppeteer', { paths: [process.cwd()] }));
+const AsyncFunction = Object.getPrototypeOf(async function () {}).constructor;
+
+const MAX_COMPILED = 32;
+const compiled = new Map();
+let browser = null;
+let browserEndpoint = null;
+let activeContext = null;
+
+const send = (message) => process.stdout.write(JSON.stringify(message) + '\n');
+
+async function connect(endpoint) {
+    if (!browser || !browser.isConnected() || endpoint !== browserEndpoint) {
+        if (browser) browser.disconnect();
+        browser = await puppeteer.connect({
+            browserWSEndpoint: endpoint,
+            defaultViewport: { width: 1280, height: 720 }
+        });
+        browserEndpoint = endpoint;
+    }
+    return browser;
+}
+
+function compile(script) {
+    // Generated scripts repeat across runs; reuse the compiled function
+    let fn = compiled.get(script);
+    if (!fn) {
+        if (compiled.size >= MAX_COMPILED) compiled.delete(compiled.keys().next().value);
+        fn = new AsyncFunction('browser', 'console', 'emit', script);
+        compiled.set(script, fn);
+    }
+    return fn;
+}
+
+async function run(command) {
+    const { id } = command;
+    const scriptConsole = {
+        log: (...args) => send({ id, type: 'log', line: util.format(...args) }),
+        error: (...args) => send({ id, type: 'stderr', line: util.format(...args) })
+    };
+    const emit = (message) => send({ ...message, id });
+
+    let context;
+    try {
+        // Isolate each run (cookies, cache, storage); closing the context also
+        // closes every page the script opened. Puppeteer 22 renamed the method.
+        const shared = await connect(command.ws);
+        context = activeContext = await (shared.createBrowserContext
+            ? shared.createBrowserContext()
+            : shared.createIncognitoBrowserContext());
+        await compile(command.script)(context, scriptConsole, emit);
+        send({ id, type: 'done', ok: true });
+    } catch (error) {
+        send({ id, type: 'done', ok: false, error: error.message });
+    } finally {
+        activeContext = null;
+        if (context) await context.close().catch(() => {});
+    }
+}
+
+// Commands are handled strictly one at a time, in arrival order
+let pending = Promise.resolve();
+const commands = readline.createInterface({ input: process.stdin });
+
+commands.on('line', (line) => {
+    let command;
+    try {
+        command = JSON.parse(line);
+    } catch (error) {
+        return;  // Ignore anything that isn't a command
+    }
+    if (command.op === 'run') pending = pending.then(() => run(command));
+});
+
+// Parent closed our stdin (exit or dropped session): let go of the browser and stop
+commands.on('close', () => pending.then(() => {
+    if (browser) browser.disconnect();
+    process.exit(0);
+}));
+
+// Cancel or timeout from Python: close the run's pages in the shared browser first
+process.on('SIGTERM', () => {
+    Promise.resolve(activeContext && activeContext.close())
+        .catch(() => {})
+        .finally(() => process.exit(143));
+});